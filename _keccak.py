@@ -0,0 +1,162 @@
+"""
+Keccak-f[1600] and SHA3X hashing kernels for the demo miner
+Numba-compiled CPU fallback used by sha3x_demo.py; the hashlib reference
+lives in _sha3x
+"""
+
+import numpy as np
+from numba import njit
+
+# Keccak-f[1600] parameters
+STATE_SIZE = 25
+ROUNDS = 24
+
+# Round constants for Keccak-f[1600]
+RC = np.array(
+    [
+        0x0000000000000001, 0x0000000000008082, 0x800000000000808A,
+        0x8000000080008000, 0x000000000000808B, 0x0000000080000001,
+        0x8000000080008081, 0x8000000000008009, 0x000000000000008A,
+        0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+        0x000000008000808B, 0x800000000000008B, 0x8000000000008089,
+        0x8000000000008003, 0x8000000000008002, 0x8000000000000080,
+        0x000000000000800A, 0x800000008000000A, 0x8000000080008081,
+        0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+    ],
+    dtype=np.uint64,
+)
+
+# Rho rotation offset and pi destination, indexed by source lane
+RHO_LANE = np.array(
+    [0, 1, 62, 28, 27, 36, 44, 6, 55, 20, 3, 10, 43,
+     25, 39, 41, 45, 15, 21, 8, 18, 2, 61, 56, 14],
+    dtype=np.uint64,
+)
+PI_LANE = np.array(
+    [0, 10, 20, 5, 15, 16, 1, 11, 21, 6, 7, 17, 2,
+     12, 22, 23, 8, 18, 3, 13, 14, 24, 9, 19, 4],
+    dtype=np.int64,
+)
+
+# SHA3 domain padding and the final rate bit of a 136-byte block
+PAD_SHA3 = np.uint64(0x06)
+PAD_LAST = np.uint64(0x8000000000000000)
+
+
+@njit(cache=True, inline="always")
+def bswap64(x):
+    """Reverse the byte order of a 64-bit lane (LLVM lowers this to BSWAP)"""
+    x = ((x & np.uint64(0x00FF00FF00FF00FF)) << np.uint64(8)) | (
+        (x >> np.uint64(8)) & np.uint64(0x00FF00FF00FF00FF)
+    )
+    x = ((x & np.uint64(0x0000FFFF0000FFFF)) << np.uint64(16)) | (
+        (x >> np.uint64(16)) & np.uint64(0x0000FFFF0000FFFF)
+    )
+    return (x << np.uint64(32)) | (x >> np.uint64(32))
+
+
+def _rotl_expr(expr, n):
+    """Source for a left rotate of expr by the literal count n"""
+    if n == 0:
+        return expr
+    return f"(({expr} << np.uint64({n})) | ({expr} >> np.uint64({64 - n})))"
+
+
+def _unrolled_permute_source():
+    """
+    Source for Keccak-f[1600] with all 24 rounds written out. Lanes arrive
+    and leave as a 25-tuple and live in the locals a0..a24 in between, and
+    every rotate count and round constant is a literal, so LLVM keeps the
+    state in registers and emits immediate-count rotates.
+    """
+    lanes = ", ".join(f"a{i}" for i in range(STATE_SIZE))
+    lines = ["def permute_lanes(s):", f"    {lanes} = s"]
+    for r in range(ROUNDS):
+        # θ (theta) step
+        for x in range(5):
+            lines.append(f"    c{x} = a{x} ^ a{x + 5} ^ a{x + 10} ^ a{x + 15} ^ a{x + 20}")
+        for x in range(5):
+            lines.append(f"    d{x} = c{(x + 4) % 5} ^ {_rotl_expr(f'c{(x + 1) % 5}', 1)}")
+
+        # ρ (rho) and π (pi) steps
+        for i in range(STATE_SIZE):
+            lines.append(
+                f"    b{PI_LANE[i]} = {_rotl_expr(f'(a{i} ^ d{i % 5})', int(RHO_LANE[i]))}"
+            )
+
+        # χ (chi) step
+        for j in range(0, 25, 5):
+            for x in range(5):
+                lines.append(
+                    f"    a{j + x} = b{j + x} ^ (~b{j + (x + 1) % 5} & b{j + (x + 2) % 5})"
+                )
+
+        # ι (iota) step
+        lines.append(f"    a0 ^= np.uint64({int(RC[r]):#018x})")
+    lines.append(f"    return ({lanes})")
+    return "\n".join(lines) + "\n"
+
+
+def _compile_permute(jit=njit):
+    """
+    Build the unrolled permutation once at import time, compiled with jit
+    (sha3x_cuda passes a CUDA device-function decorator)
+    """
+    namespace = {"np": np}
+    exec(compile(_unrolled_permute_source(), "<keccak_f1600_unrolled>", "exec"), namespace)
+    return jit(namespace["permute_lanes"])
+
+
+# Keccak-f[1600] permutation on a UniTuple(uint64, 25) state, returning the
+# permuted tuple
+permute_lanes = _compile_permute()
+
+
+@njit(cache=True)
+def sha3x_hash(nonce, header):
+    """
+    SHA3X digest of one nonce: SHA3-256 applied three times to
+    nonce (LE) || mining_hash || 0x01. The 41-byte input and the 32-byte
+    intermediate digests each fit in one 136-byte rate block, so every
+    round is a single absorb + permute. The state never leaves registers;
+    the digest is returned as four uint64 lanes.
+    """
+    z = np.uint64(0)
+
+    # First pass: 41-byte SHA3X header
+    s = permute_lanes((
+        nonce, header[0], header[1], header[2], header[3],
+        np.uint64(0x01) | (PAD_SHA3 << np.uint64(8)), z, z, z, z,
+        z, z, z, z, z,
+        z, PAD_LAST, z, z, z,
+        z, z, z, z, z,
+    ))
+
+    # Second and third passes: 32-byte digest of the previous pass
+    for _ in range(2):
+        s = permute_lanes((
+            s[0], s[1], s[2], s[3], PAD_SHA3,
+            z, z, z, z, z,
+            z, z, z, z, z,
+            z, PAD_LAST, z, z, z,
+            z, z, z, z, z,
+        ))
+    return s[0], s[1], s[2], s[3]
+
+
+@njit(cache=True)
+def scan(header, nonce_base, count, target):
+    """
+    Hash count consecutive nonces starting at nonce_base and report
+    whether any of them meets target. The check is branchless: the
+    big-endian top 64 bits of each digest are compared against target and
+    OR-ed into one flag; the caller re-hashes flagged ranges with the
+    hashlib reference (_sha3x.find_shares) to locate the winners.
+    """
+    base = np.uint64(nonce_base)
+    limit = np.uint64(target)
+    found = np.uint64(0)
+    for i in range(count):
+        d0 = sha3x_hash(base + np.uint64(i), header)[0]
+        found |= np.uint64(bswap64(d0) < limit)
+    return found != 0
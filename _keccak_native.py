@@ -0,0 +1,91 @@
+"""
+ctypes bindings for the native SHA3X Keccak kernels (src/sha3x_keccak_*.c)
+Built by CMake as the sha3x_keccak shared library; every entry point is
+optional and reported unavailable when the library or CPU feature is missing
+"""
+
+import ctypes
+import os
+import sys
+
+import numpy as np
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+# CMake output locations for single- and multi-config generators
+_SEARCH_DIRS = (
+    os.path.join(_HERE, "build"),
+    os.path.join(_HERE, "build", "Release"),
+    _HERE,
+)
+
+if sys.platform == "win32":
+    _LIB_NAME = "sha3x_keccak.dll"
+elif sys.platform == "darwin":
+    _LIB_NAME = "libsha3x_keccak.dylib"
+else:
+    _LIB_NAME = "libsha3x_keccak.so"
+
+_lanes = np.ctypeslib.ndpointer(dtype=np.uint64, flags="C_CONTIGUOUS")
+
+
+def _load_library():
+    """Load sha3x_keccak from the first build directory that has it"""
+    for directory in _SEARCH_DIRS:
+        path = os.path.join(directory, _LIB_NAME)
+        if not os.path.exists(path):
+            continue
+        try:
+            return ctypes.CDLL(path)
+        except OSError:
+            continue
+    return None
+
+
+_lib = _load_library()
+
+BMI2_AVAILABLE = False
+AVX2_AVAILABLE = False
+AVX512_AVAILABLE = False
+if _lib is not None:
+    _lib.keccak_bmi2_supported.restype = ctypes.c_int
+    _lib.keccak_bmi2_supported.argtypes = []
+    _lib.sha3x_scan_bmi2.restype = ctypes.c_int
+    _lib.sha3x_scan_bmi2.argtypes = [_lanes, ctypes.c_uint64, ctypes.c_uint64, ctypes.c_uint64]
+    BMI2_AVAILABLE = bool(_lib.keccak_bmi2_supported())
+
+    _lib.keccak_avx2_supported.restype = ctypes.c_int
+    _lib.keccak_avx2_supported.argtypes = []
+    _lib.sha3x_scan_x4_avx2.restype = ctypes.c_int
+    _lib.sha3x_scan_x4_avx2.argtypes = [_lanes, ctypes.c_uint64, ctypes.c_uint64, ctypes.c_uint64]
+    AVX2_AVAILABLE = bool(_lib.keccak_avx2_supported())
+
+    _lib.keccak_avx512_supported.restype = ctypes.c_int
+    _lib.keccak_avx512_supported.argtypes = []
+    _lib.sha3x_scan_x8_avx512.restype = ctypes.c_int
+    _lib.sha3x_scan_x8_avx512.argtypes = [_lanes, ctypes.c_uint64, ctypes.c_uint64, ctypes.c_uint64]
+    AVX512_AVAILABLE = bool(_lib.keccak_avx512_supported())
+
+
+def scan_bmi2(header, nonce_base, count, target):
+    """
+    Hash count consecutive nonces starting at nonce_base with the BMI2
+    kernel; True when any of them meets target
+    """
+    return bool(_lib.sha3x_scan_bmi2(header, nonce_base, count, target))
+
+
+def scan_x4_avx2(header, nonce_base, count, target):
+    """
+    Hash count consecutive nonces (a multiple of 4) four at a time with the
+    AVX2 kernel; True when any of them meets target
+    """
+    return bool(_lib.sha3x_scan_x4_avx2(header, nonce_base, count, target))
+
+
+def scan_x8_avx512(header, nonce_base, count, target):
+    """
+    Hash count consecutive nonces (a multiple of 8) eight at a
+    time; True when any of them meets target
+    """
+    return bool(_lib.sha3x_scan_x8_avx512(header, nonce_base, count, target))
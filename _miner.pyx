@@ -0,0 +1,69 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled SHA3X mining driver for the demo miner
+Splits a nonce burst into chunks and hashes them in an OpenMP prange with
+the GIL released, using the native Keccak kernels from src/
+
+Build in place with: python build_miner.py build_ext --inplace
+"""
+
+from cython.parallel cimport prange
+from libc.stdint cimport uint64_t
+
+cdef extern from "sha3x_keccak.h" nogil:
+    int keccak_bmi2_supported()
+    int keccak_avx2_supported()
+    int keccak_avx512_supported()
+    int sha3x_scan_bmi2(const uint64_t *header, uint64_t nonce_base, uint64_t count, uint64_t target)
+    int sha3x_scan_x4_avx2(const uint64_t *header, uint64_t nonce_base, uint64_t count, uint64_t target)
+    int sha3x_scan_x8_avx512(const uint64_t *header, uint64_t nonce_base, uint64_t count, uint64_t target)
+
+# Nonces per prange work item (a multiple of the AVX-512 batch)
+cdef enum:
+    CHUNK = 4096
+
+CHUNK_SIZE = CHUNK
+
+cdef bint _avx512 = keccak_avx512_supported() != 0
+cdef bint _avx2 = keccak_avx2_supported() != 0
+cdef bint _bmi2 = keccak_bmi2_supported() != 0
+
+# True when this CPU can run one of the native kernels
+AVAILABLE = _avx512 or _avx2 or _bmi2
+
+
+cdef void mine_burst_nogil(const uint64_t *header, uint64_t nonce_base, uint64_t chunks,
+                           uint64_t target, unsigned char *hits) noexcept nogil:
+    cdef Py_ssize_t i
+    if _avx512:
+        for i in prange(<Py_ssize_t>chunks, schedule="static"):
+            hits[i] = sha3x_scan_x8_avx512(header, nonce_base + <uint64_t>i * CHUNK, CHUNK, target)
+    elif _avx2:
+        for i in prange(<Py_ssize_t>chunks, schedule="static"):
+            hits[i] = sha3x_scan_x4_avx2(header, nonce_base + <uint64_t>i * CHUNK, CHUNK, target)
+    else:
+        for i in prange(<Py_ssize_t>chunks, schedule="static"):
+            hits[i] = sha3x_scan_bmi2(header, nonce_base + <uint64_t>i * CHUNK, CHUNK, target)
+
+
+def mine_burst(uint64_t nonce_base, uint64_t batch, const uint64_t[::1] header not None,
+               uint64_t target):
+    """
+    Hash batch consecutive nonces from nonce_base (rounded down to whole
+    chunks) across all OpenMP threads. Returns the number of nonces hashed
+    and the base nonce of every CHUNK_SIZE chunk that holds a share.
+    """
+    if not AVAILABLE:
+        raise RuntimeError("CPU supports none of AVX-512, AVX2 or BMI2")
+    if header.shape[0] != 4:
+        raise ValueError("header must hold four uint64 lanes")
+
+    cdef uint64_t chunks = batch // CHUNK
+    cdef unsigned char[::1] hits
+    if chunks == 0:
+        return 0, []
+
+    hits = bytearray(chunks)
+    with nogil:
+        mine_burst_nogil(&header[0], nonce_base, chunks, target, &hits[0])
+    return chunks * CHUNK, [nonce_base + i * CHUNK for i in range(chunks) if hits[i]]
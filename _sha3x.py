@@ -0,0 +1,46 @@
+"""
+SHA3X parameters and hashlib reference for the demo miner
+Pure Python, so shares can be verified without Numba or the native kernels
+"""
+
+import hashlib
+
+import numpy as np
+
+# SHA3X parameters (mirrors src/sha3x_algo.h)
+SHA3X_HASH_SIZE = 32
+SHA3X_NONCE_SIZE = 8
+SHA3X_INPUT_SIZE = 41  # nonce || mining_hash || 0x01
+
+
+def header_lanes(mining_hash):
+    """Split a 32-byte mining hash into four little-endian uint64 lanes"""
+    if len(mining_hash) != SHA3X_HASH_SIZE:
+        raise ValueError(f"mining hash must be {SHA3X_HASH_SIZE} bytes")
+    return np.frombuffer(mining_hash, dtype="<u8").astype(np.uint64)
+
+
+def sha3x_digest(mining_hash, nonce):
+    """hashlib reference SHA3X digest of one nonce, for share verification"""
+    data = nonce.to_bytes(SHA3X_NONCE_SIZE, "little") + mining_hash + b"\x01"
+    for _ in range(3):
+        data = hashlib.sha3_256(data).digest()
+    return data
+
+
+def verify_share(mining_hash, nonce, target):
+    """True when the reference digest of nonce meets target"""
+    digest = sha3x_digest(mining_hash, nonce)
+    return int.from_bytes(digest[:8], "big") < target
+
+
+def find_shares(mining_hash, nonce_base, count, target):
+    """
+    Slow path after a kernel flags a range: re-hash count nonces from
+    nonce_base and return those whose reference digest meets target
+    """
+    return [
+        nonce
+        for nonce in range(nonce_base, nonce_base + count)
+        if verify_share(mining_hash, nonce, target)
+    ]
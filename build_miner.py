@@ -0,0 +1,47 @@
+"""
+Build the Cython mining driver (_miner.pyx) in place:
+
+    python build_miner.py build_ext --inplace
+
+OpenMP flags are picked per compiler, so prange runs multi-threaded with
+MSVC (/openmp) as well as GCC and Clang (-fopenmp)
+"""
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+from setuptools.command.build_ext import build_ext
+
+# (compile args, link args) per distutils compiler type
+_OPENMP_FLAGS = {
+    "msvc": (["/O2", "/openmp"], []),
+}
+_DEFAULT_FLAGS = (["-O3", "-fopenmp"], ["-fopenmp"])
+
+
+class OpenMPBuildExt(build_ext):
+    """build_ext that adds the OpenMP flags for the active compiler"""
+
+    def build_extensions(self):
+        compile_args, link_args = _OPENMP_FLAGS.get(self.compiler.compiler_type, _DEFAULT_FLAGS)
+        for extension in self.extensions:
+            extension.extra_compile_args = compile_args
+            extension.extra_link_args = link_args
+        super().build_extensions()
+
+
+extension = Extension(
+    "_miner",
+    sources=[
+        "_miner.pyx",
+        "src/sha3x_keccak_bmi2.c",
+        "src/sha3x_keccak_avx2.c",
+        "src/sha3x_keccak_avx512.c",
+    ],
+    include_dirs=["src"],
+)
+
+setup(
+    name="sha3x_demo_miner",
+    ext_modules=cythonize([extension], compiler_directives={"language_level": 3}),
+    cmdclass={"build_ext": OpenMPBuildExt},
+)
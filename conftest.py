@@ -0,0 +1,52 @@
+"""
+Shared fixtures for the demo miner tests
+Every hash backend is checked against the hashlib reference in _sha3x;
+tests for backends this host cannot run are skipped.
+"""
+
+import os
+
+import pytest
+
+import _sha3x
+
+# The CUDA tests run under the Numba simulator unless NUMBA_ENABLE_CUDASIM
+# is already set to something else (0 tests a real device); Numba reads it
+# on first import, so it is set before any test module loads
+os.environ.setdefault("NUMBA_ENABLE_CUDASIM", "1")
+
+# Loose target: about one winning nonce in 512
+LOOSE_TARGET = (1 << 64) // 512
+
+# Nonces covered by scan_windows, in 64-nonce windows (a multiple of every
+# SIMD batch width)
+SCAN_NONCES = 4096
+SCAN_WINDOW = 64
+
+
+@pytest.fixture(scope="session")
+def mining_hash():
+    return bytes(range(_sha3x.SHA3X_HASH_SIZE))
+
+
+@pytest.fixture(scope="session")
+def header(mining_hash):
+    return _sha3x.header_lanes(mining_hash)
+
+
+@pytest.fixture(scope="session")
+def target():
+    return LOOSE_TARGET
+
+
+@pytest.fixture(scope="session")
+def scan_windows(mining_hash):
+    """(nonce_base, count, hit) for each window, from the hashlib reference"""
+    winners = _sha3x.find_shares(mining_hash, 0, SCAN_NONCES, LOOSE_TARGET)
+    windows = [
+        (base, SCAN_WINDOW, any(base <= nonce < base + SCAN_WINDOW for nonce in winners))
+        for base in range(0, SCAN_NONCES, SCAN_WINDOW)
+    ]
+    # The loose target must leave both hits and misses among the windows
+    assert {hit for _, _, hit in windows} == {True, False}
+    return windows
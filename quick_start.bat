@@ -33,6 +33,10 @@ if exist "build_real\sha3x_miner.exe" (
     echo 4. Use: start_sha3x_miner.bat (full launcher)
     echo.
     echo 💡 For now, you can test with the Python demo:
+    echo    pip install numpy numba cython setuptools
+    echo    cmake -S . -B build -DCMAKE_BUILD_TYPE=Release
+    echo    cmake --build build --config Release --target sha3x_keccak
+    echo    python build_miner.py build_ext --inplace
     echo    PYTHONIOENCODING=utf-8 python sha3x_demo.py
 )
 
@@ -5,16 +5,156 @@ Shows the miner functionality with live simulation
 """
 
 import time
-import random
 import json
-import datetime
 import os
+import sys
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used instead
+    orjson = None
+
+import _keccak_native
+import _sha3x
+
+try:
+    import _miner  # optional: built with build_miner.py
+except ImportError:
+    _miner = None
+
+try:
+    import _keccak  # optional: Numba CPU fallback
+except ImportError:
+    _keccak = None
+
+try:
+    import sha3x_cuda  # optional: needs numba.cuda
+except ImportError:
+    sha3x_cuda = None
+
+# Length of the mining run
+MINING_SECONDS = 60
+
+# Nonces hashed per CPU kernel call (a multiple of the AVX-512 batch)
+HASH_CHUNK = 1 << 12
+
+# Share difficulty: about a 15% chance of a share per second at the
+# 45 MH/s target; a digest wins when its big-endian top 64 bits < target
+SHARE_DIFFICULTY = 1 << 28
+SHARE_TARGET = (1 << 64) // SHARE_DIFFICULTY
+
+# Nonces per compiled-driver burst: one _miner chunk per OpenMP thread
+MINER_BURST = _miner.CHUNK_SIZE * (os.cpu_count() or 1) if _miner is not None else 0
+
+
+def _encode(text):
+    """
+    UTF-8 encode output once at import, with the platform line ending the
+    text layer would have written, so _write_bytes can skip that layer
+    """
+    return text.replace("\n", os.linesep).encode("utf-8")
+
+
+_NEWLINE = _encode("\n")
+
+# Status line fragments, encoded once at import
+_STATUS_HEADER = _encode("\n=== Mining Status ===\n")
+_TIME_PREFIX = _encode("⏱️  Time: ")
+_HR_PREFIX = _encode("⚡ Hashrate: ")
+_TEMP_PREFIX = _encode("🌡️  Temperature: ")
+_SHARES_PREFIX = _encode("💰 Shares: ")
+_RATE_PREFIX = _encode("📈 Acceptance Rate: ")
+_STATUS_FOOTER = _encode("🌐 Pool: Connected\n====================\n\n")
+
+# Simulated fault/recovery walkthrough, formatted once at import
+_DEMO_ERRORS = (
+    ("Connection Lost", "Pool connection timeout after 30s"),
+    ("GPU Memory Error", "Out of memory on device 0"),
+    ("Share Rejected", "Invalid solution format"),
+    ("Thermal Warning", "GPU temperature >85°C"),
+    ("Network Disruption", "Intermittent connectivity issues"),
+)
+_ERROR_REPORT = "🔧 Demonstrating Error Handling:\n" + "".join(
+    f"  ❌ {error_type}: {description}\n"
+    "  🔄 Recovery: Automatic retry initiated\n"
+    "  ✅ Resolved: Connection restored\n\n"
+    for error_type, description in _DEMO_ERRORS
+)
+
+# Startup banner and API summary, encoded once at import
+_BANNER = _encode(
+    "=" * 40 + "\n"
+    "🚀 SHA3X Miner for XTM - LIVE DEMO 🚀\n"
+    + "=" * 40 + "\n"
+    "📍 Pool: xtm-c29-us.kryptex.network:8040\n"
+    "💰 Wallet: 12LfqTi7aQKz9cpxU1AsRW7zNCRkKYdwsxVB1Qx47q3ZGS2DQUpMHDKoAdi2apbaFDdHzrjnDbe4jK1B4DbYo4titQH\n"
+    "🖥️  Worker: 9070xt\n"
+    "⚡ Algorithm: SHA3X (Keccak-f[1600])\n"
+    + "=" * 40 + "\n\n"
+)
+_API_INFO = _encode(
+    "\n🌐 API Server Information:\n"
+    "📊 Stats Endpoint: http://localhost:8080/stats\n"
+    "🎮 Control Endpoints:\n"
+    "  - Start Mining: POST /control/start\n"
+    "  - Stop Mining: POST /control/stop\n"
+    "  - Set Intensity: POST /control/intensity\n"
+    "🌐 Web Interface: http://localhost:8080/\n"
+    "📋 Configuration: GET /config\n"
+    "❓ Help: GET /help\n\n"
+)
+
+
+def _uniform_draws(n):
+    """
+    n uniform floats in [0, 1) from a single os.urandom read: the top 53
+    bits of each random uint64 scaled by 2**-53
+    """
+    draws = np.frombuffer(os.urandom(n * 8), dtype=np.uint64)
+    return (draws >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+def _write_bytes(data):
+    """
+    Write pre-encoded output straight to the stdout buffer. Streams with no
+    buffer (StringIO redirects, IDLE, notebooks) get it decoded through
+    their text layer instead.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode("utf-8").replace(os.linesep, "\n"))
+        sys.stdout.flush()
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
 
 
 class SHA3XDemoMiner:
+    __slots__ = (
+        "pool_url",
+        "wallet_address",
+        "worker_name",
+        "is_mining",
+        "is_connected",
+        "current_hashrate",
+        "total_shares",
+        "accepted_shares",
+        "rejected_shares",
+        "temperature",
+        "mining_hash",
+        "nonce",
+        "gpu_scanner",
+        "found_nonces",
+        "_wallet_display",
+    )
+
     def __init__(self, pool_url, wallet_address, worker_name):
         self.pool_url = pool_url
         self.wallet_address = wallet_address
+        self._wallet_display = wallet_address[:20]
         self.worker_name = worker_name
         self.is_mining = False
         self.is_connected = False
@@ -23,13 +163,18 @@ class SHA3XDemoMiner:
         self.accepted_shares = 0
         self.rejected_shares = 0
         self.temperature = 75.0
+        # No live job in the demo; hash against a random mining hash
+        self.mining_hash = _sha3x.header_lanes(os.urandom(_sha3x.SHA3X_HASH_SIZE))
+        self.nonce = 0
+        self.gpu_scanner = None
+        self.found_nonces = []
 
     def connect(self):
         print(f"🔗 Connecting to XTM pool: {self.pool_url}")
         time.sleep(2)
         self.is_connected = True
         print("✅ Connected to pool successfully")
-        print(f"💰 Wallet: {self.wallet_address[:20]}...")
+        print(f"💰 Wallet: {self._wallet_display}...")
         print(f"🖥️  Worker: {self.worker_name}")
         return True
 
@@ -42,117 +187,231 @@ class SHA3XDemoMiner:
         print("\n🚀 Starting SHA3X mining...")
         print("⚡ Target hashrate: 45-55 MH/s (RX 9070 XT)")
         print("🌡️  Target temperature: <85°C")
-        print("📊 API available at: http://localhost:8080/\n")
-
-        start_time = datetime.datetime.now()
+        print("📊 API available at: http://localhost:8080/")
+
+        if sha3x_cuda is not None and sha3x_cuda.is_available():
+            self.gpu_scanner = sha3x_cuda.CudaSHA3XScanner()
+            print("🖥️  Backend: CUDA\n")
+            # Compile the kernel before the clock starts
+            self.gpu_scanner.scan(self.mining_hash, 0, 0)
+        elif _miner is not None and _miner.AVAILABLE:
+            print("🖥️  Backend: CPU (Cython/OpenMP)\n")
+        elif _keccak_native.AVX512_AVAILABLE:
+            print("🖥️  Backend: CPU (AVX-512 x8)\n")
+        elif _keccak_native.AVX2_AVAILABLE:
+            print("🖥️  Backend: CPU (AVX2 x4)\n")
+        elif _keccak_native.BMI2_AVAILABLE:
+            print("🖥️  Backend: CPU (BMI2)\n")
+        elif _keccak is not None:
+            print("🖥️  Backend: CPU (Numba)\n")
+            # Only the Numba fallback pays for JIT compilation, before the
+            # clock starts
+            _keccak.scan(self.mining_hash, np.uint64(0), 1, np.uint64(0))
+        else:
+            print("❌ No hashing backend: install numba or build the native kernels")
+            self.is_mining = False
+            return
 
-        for i in range(60):  # Run for 60 iterations
-            if not self.is_mining:
+        # Temperature and pool acceptance stay simulated, from a single
+        # urandom read: one temperature per second, and a pool of share
+        # verdicts that is refilled if more shares than seconds are found
+        draws = _uniform_draws(2 * MINING_SECONDS)
+        temps = draws[:MINING_SECONDS]
+        verdicts = draws[MINING_SECONDS:]
+        verdict = 0
+
+        # Hot-loop lookups bound once as locals
+        now = time.monotonic
+        run_batch = self.run_batch
+        found = self.found_nonces
+        mining = self.is_mining
+
+        start = now()
+        deadline = start + MINING_SECONDS
+        hashes = 0
+        next_tick = start + 1.0
+        next_status = 0
+
+        # Hash back to back; stats and simulated events fire once per second
+        while mining:
+            hashes += run_batch()
+            t = now()
+
+            # Submit verified shares; the pool's verdict is simulated
+            if found:
+                for _ in found:
+                    if verdict == len(verdicts):
+                        verdicts = _uniform_draws(MINING_SECONDS)
+                        verdict = 0
+                    self.total_shares += 1
+                    accepted = verdicts[verdict] < 0.92  # 92% acceptance rate
+                    verdict += 1
+                    if accepted:
+                        self.accepted_shares += 1
+                        print(
+                            f"✅ Share accepted! ({self.accepted_shares}/{self.total_shares})"
+                        )
+                    else:
+                        self.rejected_shares += 1
+                        print(f"❌ Share rejected ({self.rejected_shares} total)")
+                found.clear()
+
+            if t >= next_tick:
+                mining = self.is_mining
+                elapsed = t - start
+                second = int(elapsed)
+                self.current_hashrate = hashes / elapsed / 1e6
+                self.temperature = 72.0 + 10.0 * temps[min(second, MINING_SECONDS) - 1]
+
+                # Print status every 5 seconds, stamped with the real time
+                if second >= next_status:
+                    self.print_status(second)
+                    next_status = second - second % 5 + 5
+                # Re-align to the clock after a batch slower than a second
+                next_tick = start + second + 1
+
+            if t >= deadline:
                 break
 
-            # Simulate hashrate
-            self.current_hashrate = random.uniform(42.0, 52.0)
-            self.temperature = random.uniform(72.0, 82.0)
-
-            # Simulate finding shares
-            if random.randint(0, 100) < 15:  # 15% chance per iteration
-                self.total_shares += 1
-                if random.randint(0, 100) < 92:  # 92% acceptance rate
-                    self.accepted_shares += 1
-                    print(
-                        f"✅ Share accepted! ({self.accepted_shares}/{self.total_shares})"
-                    )
-                else:
-                    self.rejected_shares += 1
-                    print(f"❌ Share rejected ({self.rejected_shares} total)")
-
-            # Print status every 5 iterations
-            if i % 5 == 0:
-                self.print_status(i)
-
-            time.sleep(1)
-
-        elapsed = (datetime.datetime.now() - start_time).total_seconds()
+        elapsed = now() - start
+        self.current_hashrate = hashes / elapsed / 1e6
         self.print_final_results(int(elapsed))
 
-    def print_status(self, iteration):
-        print("\n=== Mining Status ===")
-        print(f"⏱️  Time: {iteration}s")
-        print(f"⚡ Hashrate: {self.current_hashrate:.2f} MH/s")
-        print(f"🌡️  Temperature: {self.temperature:.1f}°C")
-        print(
-            f"💰 Shares: {self.accepted_shares} accepted, {self.rejected_shares} rejected"
+    def run_batch(self):
+        """
+        Hash one batch of nonces on the fastest available backend. Kernels
+        only flag whether a batch holds a share; flagged ranges take the
+        slow path through collect_shares.
+        """
+        header = self.mining_hash
+        nonce = self.nonce
+        if self.gpu_scanner is not None:
+            winner = self.gpu_scanner.scan(header, nonce, SHARE_TARGET)
+            count = self.gpu_scanner.batch_size
+            if winner is not None:
+                self.verify_share(winner)
+        elif _miner is not None and _miner.AVAILABLE:
+            count, hit_chunks = _miner.mine_burst(nonce, MINER_BURST, header, SHARE_TARGET)
+            for chunk_base in hit_chunks:
+                self.collect_shares(chunk_base, _miner.CHUNK_SIZE)
+        else:
+            count = HASH_CHUNK
+            if _keccak_native.AVX512_AVAILABLE:
+                hit = _keccak_native.scan_x8_avx512(header, nonce, count, SHARE_TARGET)
+            elif _keccak_native.AVX2_AVAILABLE:
+                hit = _keccak_native.scan_x4_avx2(header, nonce, count, SHARE_TARGET)
+            elif _keccak_native.BMI2_AVAILABLE:
+                hit = _keccak_native.scan_bmi2(header, nonce, count, SHARE_TARGET)
+            else:
+                hit = _keccak.scan(header, np.uint64(nonce), count, np.uint64(SHARE_TARGET))
+            if hit:
+                self.collect_shares(nonce, count)
+        self.nonce += count
+        return count
+
+    def collect_shares(self, nonce_base, count):
+        """
+        Slow path for a flagged range: re-hash it with the hashlib reference
+        and queue every nonce that meets the share target, so no backend
+        needs Numba to report shares
+        """
+        mining_hash = self.mining_hash.astype("<u8").tobytes()
+        self.found_nonces.extend(
+            _sha3x.find_shares(mining_hash, nonce_base, count, SHARE_TARGET)
         )
 
+    def verify_share(self, nonce):
+        """Queue a GPU winner once the hashlib reference digest confirms it"""
+        mining_hash = self.mining_hash.astype("<u8").tobytes()
+        if _sha3x.verify_share(mining_hash, nonce, SHARE_TARGET):
+            self.found_nonces.append(nonce)
+        else:
+            print(f"⚠️  Discarded invalid share (nonce {nonce})")
+
+    def print_status(self, iteration):
+        parts = [
+            _STATUS_HEADER,
+            _TIME_PREFIX,
+            f"{iteration}s".encode(),
+            _NEWLINE,
+            _HR_PREFIX,
+            f"{self.current_hashrate:.2f} MH/s".encode(),
+            _NEWLINE,
+            _TEMP_PREFIX,
+            f"{self.temperature:.1f}°C".encode(),
+            _NEWLINE,
+            _SHARES_PREFIX,
+            f"{self.accepted_shares} accepted, {self.rejected_shares} rejected".encode(),
+            _NEWLINE,
+        ]
         if self.total_shares > 0:
             acceptance_rate = (self.accepted_shares * 100.0) / self.total_shares
-            print(f"📈 Acceptance Rate: {acceptance_rate:.1f}%")
-
-        print("🌐 Pool: Connected")
-        print("====================\n")
+            parts += [_RATE_PREFIX, f"{acceptance_rate:.1f}%".encode(), _NEWLINE]
+        parts.append(_STATUS_FOOTER)
+        _write_bytes(b"".join(parts))
 
     def print_final_results(self, elapsed_seconds):
-        print("\n=== Final Results ===")
-        print(f"⏱️  Total Runtime: {elapsed_seconds} seconds")
-        print(f"⚡ Average Hashrate: {self.current_hashrate:.2f} MH/s")
-        print(f"💰 Total Shares: {self.total_shares}")
-        print(f"✅ Accepted: {self.accepted_shares}")
-        print(f"❌ Rejected: {self.rejected_shares}")
-
+        acceptance = ""
         if self.total_shares > 0:
             acceptance_rate = (self.accepted_shares * 100.0) / self.total_shares
-            print(f"📈 Final Acceptance Rate: {acceptance_rate:.1f}%")
-
             if acceptance_rate >= 90:
-                print("✅ EXCELLENT: High share acceptance rate")
+                verdict = "✅ EXCELLENT: High share acceptance rate"
             elif acceptance_rate >= 85:
-                print("✅ GOOD: Acceptable share acceptance rate")
+                verdict = "✅ GOOD: Acceptable share acceptance rate"
             else:
-                print("⚠️  IMPROVEMENT NEEDED: Low share acceptance rate")
+                verdict = "⚠️  IMPROVEMENT NEEDED: Low share acceptance rate"
+            acceptance = f"📈 Final Acceptance Rate: {acceptance_rate:.1f}%\n{verdict}\n"
 
-        print("\n🎯 Performance Assessment:")
         if self.current_hashrate >= 45:
-            print("✅ EXCELLENT: Above target performance (45-55 MH/s target)")
+            assessment = "✅ EXCELLENT: Above target performance (45-55 MH/s target)"
         elif self.current_hashrate >= 40:
-            print("✅ GOOD: Meets performance targets")
+            assessment = "✅ GOOD: Meets performance targets"
         else:
-            print("⚠️  BELOW TARGET: Performance needs optimization")
-
-        print("\n📄 Detailed results saved to: demo_results.txt")
+            assessment = "⚠️  BELOW TARGET: Performance needs optimization"
+
+        sys.stdout.write(
+            "\n=== Final Results ===\n"
+            f"⏱️  Total Runtime: {elapsed_seconds} seconds\n"
+            f"⚡ Average Hashrate: {self.current_hashrate:.2f} MH/s\n"
+            f"💰 Total Shares: {self.total_shares}\n"
+            f"✅ Accepted: {self.accepted_shares}\n"
+            f"❌ Rejected: {self.rejected_shares}\n"
+            f"{acceptance}"
+            "\n🎯 Performance Assessment:\n"
+            f"{assessment}\n"
+            "\n📄 Detailed results saved to: demo_results.txt\n"
+        )
+        sys.stdout.flush()
         self.save_results_to_file()
 
     def save_results_to_file(self):
-        with open("demo_results.txt", "w") as file:
-            file.write("SHA3X Mining Demo Results\n")
-            file.write("========================\n")
-            file.write(f"Pool: {self.pool_url}\n")
-            file.write(f"Wallet: {self.wallet_address[:20]}...\n")
-            file.write(f"Worker: {self.worker_name}\n")
-            file.write(f"Final Hashrate: {self.current_hashrate:.2f} MH/s\n")
-            file.write(f"Total Shares: {self.total_shares}\n")
-            file.write(f"Accepted Shares: {self.accepted_shares}\n")
-            file.write(f"Rejected Shares: {self.rejected_shares}\n")
-
-            if self.total_shares > 0:
-                acceptance_rate = (self.accepted_shares * 100.0) / self.total_shares
-                file.write(f"Acceptance Rate: {acceptance_rate:.1f}%\n")
-
-            file.write("Status: SIMULATION COMPLETED\n")
-            file.write("Note: This was a demonstration run with simulated mining\n")
+        acceptance = ""
+        if self.total_shares > 0:
+            acceptance_rate = (self.accepted_shares * 100.0) / self.total_shares
+            acceptance = f"Acceptance Rate: {acceptance_rate:.1f}%\n"
+
+        body = (
+            "SHA3X Mining Demo Results\n"
+            "========================\n"
+            f"Pool: {self.pool_url}\n"
+            f"Wallet: {self._wallet_display}...\n"
+            f"Worker: {self.worker_name}\n"
+            f"Final Hashrate: {self.current_hashrate:.2f} MH/s\n"
+            f"Total Shares: {self.total_shares}\n"
+            f"Accepted Shares: {self.accepted_shares}\n"
+            f"Rejected Shares: {self.rejected_shares}\n"
+            f"{acceptance}"
+            "Status: SIMULATION COMPLETED\n"
+            "Note: This was a demonstration run with simulated mining\n"
+        )
+        with open("demo_results.txt", "wb") as file:
+            file.write(body.encode("utf-8"))
 
 
 class DemoAPIServer:
     @staticmethod
     def print_api_info():
-        print("\n🌐 API Server Information:")
-        print("📊 Stats Endpoint: http://localhost:8080/stats")
-        print("🎮 Control Endpoints:")
-        print("  - Start Mining: POST /control/start")
-        print("  - Stop Mining: POST /control/stop")
-        print("  - Set Intensity: POST /control/intensity")
-        print("🌐 Web Interface: http://localhost:8080/")
-        print("📋 Configuration: GET /config")
-        print("❓ Help: GET /help\n")
+        _write_bytes(_API_INFO)
 
     @staticmethod
     def print_sample_api_response():
@@ -168,38 +427,21 @@ class DemoAPIServer:
             "temperature": 78.2,
             "devices": [{"device_id": 0, "hashrate": 48.5, "temperature": 78.2}],
         }
-        print(json.dumps(sample_response, indent=2))
-        print()
+        if orjson is not None:
+            encoded = orjson.dumps(sample_response, option=orjson.OPT_INDENT_2)
+            _write_bytes(encoded.replace(b"\n", _NEWLINE) + _NEWLINE + _NEWLINE)
+        else:
+            print(json.dumps(sample_response, indent=2))
+            print()
 
 
 def print_welcome_banner():
-    print("========================================")
-    print("🚀 SHA3X Miner for XTM - LIVE DEMO 🚀")
-    print("========================================")
-    print("📍 Pool: xtm-c29-us.kryptex.network:8040")
-    print(
-        "💰 Wallet: 12LfqTi7aQKz9cpxU1AsRW7zNCRkKYdwsxVB1Qx47q3ZGS2DQUpMHDKoAdi2apbaFDdHzrjnDbe4jK1B4DbYo4titQH"
-    )
-    print("🖥️  Worker: 9070xt")
-    print("⚡ Algorithm: SHA3X (Keccak-f[1600])")
-    print("========================================\n")
+    _write_bytes(_BANNER)
 
 
 def demonstrate_error_handling():
-    print("🔧 Demonstrating Error Handling:")
-
-    errors = [
-        ("Connection Lost", "Pool connection timeout after 30s"),
-        ("GPU Memory Error", "Out of memory on device 0"),
-        ("Share Rejected", "Invalid solution format"),
-        ("Thermal Warning", "GPU temperature >85°C"),
-        ("Network Disruption", "Intermittent connectivity issues"),
-    ]
-
-    for error_type, description in errors:
-        print(f"  ❌ {error_type}: {description}")
-        print("  🔄 Recovery: Automatic retry initiated")
-        print("  ✅ Resolved: Connection restored\n")
+    sys.stdout.write(_ERROR_REPORT)
+    sys.stdout.flush()
 
 
 def main():
@@ -0,0 +1,33 @@
+/**
+ * SHA3X Native Keccak Kernels
+ * Entry points exported by the sha3x_keccak library (src/sha3x_keccak_*.c)
+ */
+
+#ifndef SHA3X_KECCAK_H
+#define SHA3X_KECCAK_H
+
+#include <stdint.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+// BMI1/BMI2 scalar kernel (sha3x_keccak_bmi2.c)
+int keccak_bmi2_supported(void);
+void keccak_f1600_bmi2(uint64_t st[25]);
+int sha3x_scan_bmi2(const uint64_t header[4], uint64_t nonce_base, uint64_t count, uint64_t target);
+
+// AVX2 four-way kernel (sha3x_keccak_avx2.c)
+int keccak_avx2_supported(void);
+int sha3x_scan_x4_avx2(const uint64_t header[4], uint64_t nonce_base, uint64_t count, uint64_t target);
+
+// AVX-512 eight-way kernel (sha3x_keccak_avx512.c)
+int keccak_avx512_supported(void);
+void keccak_f1600_x8_avx512(uint64_t st[25 * 8]);
+int sha3x_scan_x8_avx512(const uint64_t header[4], uint64_t nonce_base, uint64_t count, uint64_t target);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif // SHA3X_KECCAK_H
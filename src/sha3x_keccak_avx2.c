@@ -0,0 +1,215 @@
+/**
+ * SHA3X Keccak-f[1600] x4 for x86-64 with AVX2
+ * Four independent Keccak states advanced in lockstep, for CPUs without
+ * AVX-512; loaded through ctypes by the Python demo miner (see
+ * _keccak_native.py). Lane i of all four sponges sits in one __m256i, the
+ * same structure-of-arrays layout as the x8 kernel in
+ * sha3x_keccak_avx512.c. AVX2 has no vector rotate or ternary logic, so
+ * rho is a shift pair and chi uses VPANDN.
+ */
+
+#include <stdint.h>
+#include <immintrin.h>
+
+#if defined(_MSC_VER)
+#include <intrin.h>
+#define SHA3X_EXPORT __declspec(dllexport)
+#define SHA3X_TARGET_AVX2
+#else
+#define SHA3X_EXPORT __attribute__((visibility("default")))
+#define SHA3X_TARGET_AVX2 __attribute__((target("avx2")))
+#endif
+
+// Sponges per vector
+#define X4 4
+
+// SHA3-256 padding within one 136-byte rate block
+#define SHA3_PAD 0x06ULL
+#define SHA3_PAD_LAST 0x8000000000000000ULL
+
+// Left rotate of each 64-bit element by the literal count n (0 < n < 64)
+#define ROL64(x, n) _mm256_or_si256(_mm256_slli_epi64((x), (n)), _mm256_srli_epi64((x), 64 - (n)))
+
+// a ^ b ^ c and a ^ (~b & c)
+#define XOR3(a, b, c) _mm256_xor_si256(_mm256_xor_si256((a), (b)), (c))
+#define CHI(a, b, c) _mm256_xor_si256((a), _mm256_andnot_si256((b), (c)))
+
+// Round constants for Keccak-f[1600]
+static const uint64_t RC[24] = {
+    0x0000000000000001ULL, 0x0000000000008082ULL, 0x800000000000808aULL,
+    0x8000000080008000ULL, 0x000000000000808bULL, 0x0000000080000001ULL,
+    0x8000000080008081ULL, 0x8000000000008009ULL, 0x000000000000008aULL,
+    0x0000000000000088ULL, 0x0000000080008009ULL, 0x000000008000000aULL,
+    0x000000008000808bULL, 0x800000000000008bULL, 0x8000000000008089ULL,
+    0x8000000000008003ULL, 0x8000000000008002ULL, 0x8000000000000080ULL,
+    0x000000000000800aULL, 0x800000008000000aULL, 0x8000000080008081ULL,
+    0x8000000000008080ULL, 0x0000000080000001ULL, 0x8000000080008008ULL
+};
+
+/**
+ * One Keccak-f[1600] round on the vector lanes a0..a24
+ */
+#define KECCAK_ROUND(rc) \
+    /* θ (theta) step */ \
+    c0 = XOR3(XOR3(a0, a5, a10), a15, a20); \
+    c1 = XOR3(XOR3(a1, a6, a11), a16, a21); \
+    c2 = XOR3(XOR3(a2, a7, a12), a17, a22); \
+    c3 = XOR3(XOR3(a3, a8, a13), a18, a23); \
+    c4 = XOR3(XOR3(a4, a9, a14), a19, a24); \
+    d0 = _mm256_xor_si256(c4, ROL64(c1, 1)); \
+    d1 = _mm256_xor_si256(c0, ROL64(c2, 1)); \
+    d2 = _mm256_xor_si256(c1, ROL64(c3, 1)); \
+    d3 = _mm256_xor_si256(c2, ROL64(c4, 1)); \
+    d4 = _mm256_xor_si256(c3, ROL64(c0, 1)); \
+    /* ρ (rho) and π (pi) steps, rotates as shift/shift/or */ \
+    b0 = _mm256_xor_si256(a0, d0); \
+    b10 = ROL64(_mm256_xor_si256(a1, d1), 1); \
+    b20 = ROL64(_mm256_xor_si256(a2, d2), 62); \
+    b5 = ROL64(_mm256_xor_si256(a3, d3), 28); \
+    b15 = ROL64(_mm256_xor_si256(a4, d4), 27); \
+    b16 = ROL64(_mm256_xor_si256(a5, d0), 36); \
+    b1 = ROL64(_mm256_xor_si256(a6, d1), 44); \
+    b11 = ROL64(_mm256_xor_si256(a7, d2), 6); \
+    b21 = ROL64(_mm256_xor_si256(a8, d3), 55); \
+    b6 = ROL64(_mm256_xor_si256(a9, d4), 20); \
+    b7 = ROL64(_mm256_xor_si256(a10, d0), 3); \
+    b17 = ROL64(_mm256_xor_si256(a11, d1), 10); \
+    b2 = ROL64(_mm256_xor_si256(a12, d2), 43); \
+    b12 = ROL64(_mm256_xor_si256(a13, d3), 25); \
+    b22 = ROL64(_mm256_xor_si256(a14, d4), 39); \
+    b23 = ROL64(_mm256_xor_si256(a15, d0), 41); \
+    b8 = ROL64(_mm256_xor_si256(a16, d1), 45); \
+    b18 = ROL64(_mm256_xor_si256(a17, d2), 15); \
+    b3 = ROL64(_mm256_xor_si256(a18, d3), 21); \
+    b13 = ROL64(_mm256_xor_si256(a19, d4), 8); \
+    b14 = ROL64(_mm256_xor_si256(a20, d0), 18); \
+    b24 = ROL64(_mm256_xor_si256(a21, d1), 2); \
+    b9 = ROL64(_mm256_xor_si256(a22, d2), 61); \
+    b19 = ROL64(_mm256_xor_si256(a23, d3), 56); \
+    b4 = ROL64(_mm256_xor_si256(a24, d4), 14); \
+    /* χ (chi) step */ \
+    a0 = CHI(b0, b1, b2); \
+    a1 = CHI(b1, b2, b3); \
+    a2 = CHI(b2, b3, b4); \
+    a3 = CHI(b3, b4, b0); \
+    a4 = CHI(b4, b0, b1); \
+    a5 = CHI(b5, b6, b7); \
+    a6 = CHI(b6, b7, b8); \
+    a7 = CHI(b7, b8, b9); \
+    a8 = CHI(b8, b9, b5); \
+    a9 = CHI(b9, b5, b6); \
+    a10 = CHI(b10, b11, b12); \
+    a11 = CHI(b11, b12, b13); \
+    a12 = CHI(b12, b13, b14); \
+    a13 = CHI(b13, b14, b10); \
+    a14 = CHI(b14, b10, b11); \
+    a15 = CHI(b15, b16, b17); \
+    a16 = CHI(b16, b17, b18); \
+    a17 = CHI(b17, b18, b19); \
+    a18 = CHI(b18, b19, b15); \
+    a19 = CHI(b19, b15, b16); \
+    a20 = CHI(b20, b21, b22); \
+    a21 = CHI(b21, b22, b23); \
+    a22 = CHI(b22, b23, b24); \
+    a23 = CHI(b23, b24, b20); \
+    a24 = CHI(b24, b20, b21); \
+    /* ι (iota) step */ \
+    a0 = _mm256_xor_si256(a0, _mm256_set1_epi64x((long long)(rc)))
+
+/**
+ * Declares the round temporaries used by KECCAK_ROUND
+ */
+#define KECCAK_TEMPS \
+    __m256i b0, b1, b2, b3, b4, b5, b6, b7, b8, b9, b10, b11, b12; \
+    __m256i b13, b14, b15, b16, b17, b18, b19, b20, b21, b22, b23, b24; \
+    __m256i c0, c1, c2, c3, c4, d0, d1, d2, d3, d4
+
+/**
+ * Hash count consecutive nonces from nonce_base, four per vector
+ * (count must be a multiple of 4). The state never leaves registers
+ * between the three SHA3-256 passes. Returns nonzero when any digest's
+ * big-endian top 64 bits are below target; each vector compare is OR-ed
+ * into an accumulator, so there is no per-nonce branch.
+ */
+SHA3X_EXPORT SHA3X_TARGET_AVX2 int sha3x_scan_x4_avx2(
+    const uint64_t header[4], uint64_t nonce_base, uint64_t count, uint64_t target
+) {
+    __m256i a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12;
+    __m256i a13, a14, a15, a16, a17, a18, a19, a20, a21, a22, a23, a24;
+    KECCAK_TEMPS;
+
+    const __m256i zero = _mm256_setzero_si256();
+    const __m256i h0 = _mm256_set1_epi64x((long long)header[0]);
+    const __m256i h1 = _mm256_set1_epi64x((long long)header[1]);
+    const __m256i h2 = _mm256_set1_epi64x((long long)header[2]);
+    const __m256i h3 = _mm256_set1_epi64x((long long)header[3]);
+    const __m256i first_pad = _mm256_set1_epi64x((long long)(0x01ULL | (SHA3_PAD << 8)));
+    const __m256i pad = _mm256_set1_epi64x((long long)SHA3_PAD);
+    const __m256i pad_last = _mm256_set1_epi64x((long long)SHA3_PAD_LAST);
+    const __m256i step = _mm256_set1_epi64x(X4);
+    // Byte reversal within each 64-bit element, for the big-endian compare
+    const __m256i bswap = _mm256_setr_epi8(
+        7, 6, 5, 4, 3, 2, 1, 0, 15, 14, 13, 12, 11, 10, 9, 8,
+        7, 6, 5, 4, 3, 2, 1, 0, 15, 14, 13, 12, 11, 10, 9, 8
+    );
+    // AVX2 only compares signed: flip the sign bits for an unsigned a < b
+    const __m256i sign = _mm256_set1_epi64x((long long)0x8000000000000000ULL);
+    const __m256i limit = _mm256_xor_si256(_mm256_set1_epi64x((long long)target), sign);
+    __m256i found = zero;
+    __m256i nonces = _mm256_add_epi64(
+        _mm256_set1_epi64x((long long)nonce_base),
+        _mm256_setr_epi64x(0, 1, 2, 3)
+    );
+
+    for (uint64_t i = 0; i < count; i += X4) {
+        // First pass: 41-byte SHA3X header
+        a0 = nonces;
+        a1 = h0; a2 = h1; a3 = h2; a4 = h3;
+        a5 = first_pad;
+        a6 = a7 = a8 = a9 = a10 = a11 = a12 = a13 = a14 = a15 = zero;
+        a16 = pad_last;
+        a17 = a18 = a19 = a20 = a21 = a22 = a23 = a24 = zero;
+        for (int round = 0; round < 24; round++) {
+            KECCAK_ROUND(RC[round]);
+        }
+
+        // Second and third passes over the 32-byte digest
+        for (int pass = 0; pass < 2; pass++) {
+            a4 = pad;
+            a5 = a6 = a7 = a8 = a9 = a10 = a11 = a12 = a13 = a14 = a15 = zero;
+            a16 = pad_last;
+            a17 = a18 = a19 = a20 = a21 = a22 = a23 = a24 = zero;
+            for (int round = 0; round < 24; round++) {
+                KECCAK_ROUND(RC[round]);
+            }
+        }
+
+        found = _mm256_or_si256(found, _mm256_cmpgt_epi64(
+            limit, _mm256_xor_si256(_mm256_shuffle_epi8(a0, bswap), sign)
+        ));
+        nonces = _mm256_add_epi64(nonces, step);
+    }
+
+    return !_mm256_testz_si256(found, found);
+}
+
+/**
+ * Nonzero when the running CPU implements AVX2
+ */
+SHA3X_EXPORT int keccak_avx2_supported(void) {
+#if defined(_MSC_VER)
+    int regs[4];
+    __cpuid(regs, 1);
+    if (!((regs[2] >> 27) & 1)) {
+        return 0;  // no OSXSAVE: YMM state is not preserved by the OS
+    }
+    if ((_xgetbv(0) & 0x6) != 0x6) {
+        return 0;
+    }
+    __cpuidex(regs, 7, 0);
+    return (regs[1] >> 5) & 1;
+#else
+    __builtin_cpu_init();
+    return __builtin_cpu_supports("avx2");
+#endif
+}
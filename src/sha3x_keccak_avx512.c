@@ -0,0 +1,289 @@
+/**
+ * SHA3X Keccak-f[1600] x8 for x86-64 with AVX-512
+ * Eight independent Keccak states advanced in lockstep, loaded through
+ * ctypes by the Python demo miner (see _keccak_native.py). The state is
+ * a (25, 8) structure-of-arrays, st[lane * 8 + sponge]:
+ * lane i of all eight sponges sits in one __m512i, so rho is one VPROLQ
+ * per lane and theta/chi use three-input VPTERNLOGQ.
+ */
+
+#include <stdint.h>
+#include <string.h>
+#include <immintrin.h>
+
+#if defined(_MSC_VER)
+#include <intrin.h>
+#define SHA3X_EXPORT __declspec(dllexport)
+#define SHA3X_TARGET_AVX512
+#else
+#define SHA3X_EXPORT __attribute__((visibility("default")))
+#define SHA3X_TARGET_AVX512 __attribute__((target("avx512f,avx512vl")))
+#endif
+
+// Sponges per vector
+#define X8 8
+
+// SHA3-256 padding within one 136-byte rate block
+#define SHA3_PAD 0x06ULL
+#define SHA3_PAD_LAST 0x8000000000000000ULL
+
+// Byte-swap masks for converting digest lanes to big-endian
+#define BSWAP_MASK8 0x00FF00FF00FF00FFULL
+#define BSWAP_MASK16 0x0000FFFF0000FFFFULL
+
+// a ^ b ^ c and a ^ (~b & c) as single VPTERNLOGQ truth tables
+#define XOR3(a, b, c) _mm512_ternarylogic_epi64((a), (b), (c), 0x96)
+#define CHI(a, b, c) _mm512_ternarylogic_epi64((a), (b), (c), 0xD2)
+
+// Round constants for Keccak-f[1600]
+static const uint64_t RC[24] = {
+    0x0000000000000001ULL, 0x0000000000008082ULL, 0x800000000000808aULL,
+    0x8000000080008000ULL, 0x000000000000808bULL, 0x0000000080000001ULL,
+    0x8000000080008081ULL, 0x8000000000008009ULL, 0x000000000000008aULL,
+    0x0000000000000088ULL, 0x0000000080008009ULL, 0x000000008000000aULL,
+    0x000000008000808bULL, 0x800000000000008bULL, 0x8000000000008089ULL,
+    0x8000000000008003ULL, 0x8000000000008002ULL, 0x8000000000000080ULL,
+    0x000000000000800aULL, 0x800000008000000aULL, 0x8000000080008081ULL,
+    0x8000000000008080ULL, 0x0000000080000001ULL, 0x8000000080008008ULL
+};
+
+/**
+ * One Keccak-f[1600] round on the vector lanes a0..a24
+ */
+#define KECCAK_ROUND(rc) \
+    /* θ (theta) step: five-way column XOR as two three-input ternlogs */ \
+    c0 = XOR3(XOR3(a0, a5, a10), a15, a20); \
+    c1 = XOR3(XOR3(a1, a6, a11), a16, a21); \
+    c2 = XOR3(XOR3(a2, a7, a12), a17, a22); \
+    c3 = XOR3(XOR3(a3, a8, a13), a18, a23); \
+    c4 = XOR3(XOR3(a4, a9, a14), a19, a24); \
+    d0 = _mm512_xor_si512(c4, _mm512_rol_epi64(c1, 1)); \
+    d1 = _mm512_xor_si512(c0, _mm512_rol_epi64(c2, 1)); \
+    d2 = _mm512_xor_si512(c1, _mm512_rol_epi64(c3, 1)); \
+    d3 = _mm512_xor_si512(c2, _mm512_rol_epi64(c4, 1)); \
+    d4 = _mm512_xor_si512(c3, _mm512_rol_epi64(c0, 1)); \
+    /* ρ (rho) and π (pi) steps, one VPROLQ per lane */ \
+    b0 = _mm512_xor_si512(a0, d0); \
+    b10 = _mm512_rol_epi64(_mm512_xor_si512(a1, d1), 1); \
+    b20 = _mm512_rol_epi64(_mm512_xor_si512(a2, d2), 62); \
+    b5 = _mm512_rol_epi64(_mm512_xor_si512(a3, d3), 28); \
+    b15 = _mm512_rol_epi64(_mm512_xor_si512(a4, d4), 27); \
+    b16 = _mm512_rol_epi64(_mm512_xor_si512(a5, d0), 36); \
+    b1 = _mm512_rol_epi64(_mm512_xor_si512(a6, d1), 44); \
+    b11 = _mm512_rol_epi64(_mm512_xor_si512(a7, d2), 6); \
+    b21 = _mm512_rol_epi64(_mm512_xor_si512(a8, d3), 55); \
+    b6 = _mm512_rol_epi64(_mm512_xor_si512(a9, d4), 20); \
+    b7 = _mm512_rol_epi64(_mm512_xor_si512(a10, d0), 3); \
+    b17 = _mm512_rol_epi64(_mm512_xor_si512(a11, d1), 10); \
+    b2 = _mm512_rol_epi64(_mm512_xor_si512(a12, d2), 43); \
+    b12 = _mm512_rol_epi64(_mm512_xor_si512(a13, d3), 25); \
+    b22 = _mm512_rol_epi64(_mm512_xor_si512(a14, d4), 39); \
+    b23 = _mm512_rol_epi64(_mm512_xor_si512(a15, d0), 41); \
+    b8 = _mm512_rol_epi64(_mm512_xor_si512(a16, d1), 45); \
+    b18 = _mm512_rol_epi64(_mm512_xor_si512(a17, d2), 15); \
+    b3 = _mm512_rol_epi64(_mm512_xor_si512(a18, d3), 21); \
+    b13 = _mm512_rol_epi64(_mm512_xor_si512(a19, d4), 8); \
+    b14 = _mm512_rol_epi64(_mm512_xor_si512(a20, d0), 18); \
+    b24 = _mm512_rol_epi64(_mm512_xor_si512(a21, d1), 2); \
+    b9 = _mm512_rol_epi64(_mm512_xor_si512(a22, d2), 61); \
+    b19 = _mm512_rol_epi64(_mm512_xor_si512(a23, d3), 56); \
+    b4 = _mm512_rol_epi64(_mm512_xor_si512(a24, d4), 14); \
+    /* χ (chi) step */ \
+    a0 = CHI(b0, b1, b2); \
+    a1 = CHI(b1, b2, b3); \
+    a2 = CHI(b2, b3, b4); \
+    a3 = CHI(b3, b4, b0); \
+    a4 = CHI(b4, b0, b1); \
+    a5 = CHI(b5, b6, b7); \
+    a6 = CHI(b6, b7, b8); \
+    a7 = CHI(b7, b8, b9); \
+    a8 = CHI(b8, b9, b5); \
+    a9 = CHI(b9, b5, b6); \
+    a10 = CHI(b10, b11, b12); \
+    a11 = CHI(b11, b12, b13); \
+    a12 = CHI(b12, b13, b14); \
+    a13 = CHI(b13, b14, b10); \
+    a14 = CHI(b14, b10, b11); \
+    a15 = CHI(b15, b16, b17); \
+    a16 = CHI(b16, b17, b18); \
+    a17 = CHI(b17, b18, b19); \
+    a18 = CHI(b18, b19, b15); \
+    a19 = CHI(b19, b15, b16); \
+    a20 = CHI(b20, b21, b22); \
+    a21 = CHI(b21, b22, b23); \
+    a22 = CHI(b22, b23, b24); \
+    a23 = CHI(b23, b24, b20); \
+    a24 = CHI(b24, b20, b21); \
+    /* ι (iota) step */ \
+    a0 = _mm512_xor_si512(a0, _mm512_set1_epi64((long long)(rc)))
+
+/**
+ * Declares the round temporaries used by KECCAK_ROUND
+ */
+#define KECCAK_TEMPS \
+    __m512i b0, b1, b2, b3, b4, b5, b6, b7, b8, b9, b10, b11, b12; \
+    __m512i b13, b14, b15, b16, b17, b18, b19, b20, b21, b22, b23, b24; \
+    __m512i c0, c1, c2, c3, c4, d0, d1, d2, d3, d4
+
+/**
+ * Reverse the byte order of each 64-bit element (AVX-512F only, no VPSHUFB)
+ */
+static SHA3X_TARGET_AVX512 __m512i bswap64_x8(__m512i x) {
+    const __m512i m8 = _mm512_set1_epi64((long long)BSWAP_MASK8);
+    const __m512i m16 = _mm512_set1_epi64((long long)BSWAP_MASK16);
+    x = _mm512_or_si512(
+        _mm512_slli_epi64(_mm512_and_si512(x, m8), 8),
+        _mm512_and_si512(_mm512_srli_epi64(x, 8), m8)
+    );
+    x = _mm512_or_si512(
+        _mm512_slli_epi64(_mm512_and_si512(x, m16), 16),
+        _mm512_and_si512(_mm512_srli_epi64(x, 16), m16)
+    );
+    return _mm512_rol_epi64(x, 32);
+}
+
+/**
+ * Keccak-f[1600] on eight states, in place on a (25, 8) uint64 array
+ */
+SHA3X_EXPORT SHA3X_TARGET_AVX512 void keccak_f1600_x8_avx512(uint64_t st[25 * X8]) {
+    __m512i a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12;
+    __m512i a13, a14, a15, a16, a17, a18, a19, a20, a21, a22, a23, a24;
+    KECCAK_TEMPS;
+
+    a0 = _mm512_loadu_si512(st + 0 * 8);
+    a1 = _mm512_loadu_si512(st + 1 * 8);
+    a2 = _mm512_loadu_si512(st + 2 * 8);
+    a3 = _mm512_loadu_si512(st + 3 * 8);
+    a4 = _mm512_loadu_si512(st + 4 * 8);
+    a5 = _mm512_loadu_si512(st + 5 * 8);
+    a6 = _mm512_loadu_si512(st + 6 * 8);
+    a7 = _mm512_loadu_si512(st + 7 * 8);
+    a8 = _mm512_loadu_si512(st + 8 * 8);
+    a9 = _mm512_loadu_si512(st + 9 * 8);
+    a10 = _mm512_loadu_si512(st + 10 * 8);
+    a11 = _mm512_loadu_si512(st + 11 * 8);
+    a12 = _mm512_loadu_si512(st + 12 * 8);
+    a13 = _mm512_loadu_si512(st + 13 * 8);
+    a14 = _mm512_loadu_si512(st + 14 * 8);
+    a15 = _mm512_loadu_si512(st + 15 * 8);
+    a16 = _mm512_loadu_si512(st + 16 * 8);
+    a17 = _mm512_loadu_si512(st + 17 * 8);
+    a18 = _mm512_loadu_si512(st + 18 * 8);
+    a19 = _mm512_loadu_si512(st + 19 * 8);
+    a20 = _mm512_loadu_si512(st + 20 * 8);
+    a21 = _mm512_loadu_si512(st + 21 * 8);
+    a22 = _mm512_loadu_si512(st + 22 * 8);
+    a23 = _mm512_loadu_si512(st + 23 * 8);
+    a24 = _mm512_loadu_si512(st + 24 * 8);
+
+    for (int round = 0; round < 24; round++) {
+        KECCAK_ROUND(RC[round]);
+    }
+
+    _mm512_storeu_si512(st + 0 * 8, a0);
+    _mm512_storeu_si512(st + 1 * 8, a1);
+    _mm512_storeu_si512(st + 2 * 8, a2);
+    _mm512_storeu_si512(st + 3 * 8, a3);
+    _mm512_storeu_si512(st + 4 * 8, a4);
+    _mm512_storeu_si512(st + 5 * 8, a5);
+    _mm512_storeu_si512(st + 6 * 8, a6);
+    _mm512_storeu_si512(st + 7 * 8, a7);
+    _mm512_storeu_si512(st + 8 * 8, a8);
+    _mm512_storeu_si512(st + 9 * 8, a9);
+    _mm512_storeu_si512(st + 10 * 8, a10);
+    _mm512_storeu_si512(st + 11 * 8, a11);
+    _mm512_storeu_si512(st + 12 * 8, a12);
+    _mm512_storeu_si512(st + 13 * 8, a13);
+    _mm512_storeu_si512(st + 14 * 8, a14);
+    _mm512_storeu_si512(st + 15 * 8, a15);
+    _mm512_storeu_si512(st + 16 * 8, a16);
+    _mm512_storeu_si512(st + 17 * 8, a17);
+    _mm512_storeu_si512(st + 18 * 8, a18);
+    _mm512_storeu_si512(st + 19 * 8, a19);
+    _mm512_storeu_si512(st + 20 * 8, a20);
+    _mm512_storeu_si512(st + 21 * 8, a21);
+    _mm512_storeu_si512(st + 22 * 8, a22);
+    _mm512_storeu_si512(st + 23 * 8, a23);
+    _mm512_storeu_si512(st + 24 * 8, a24);
+}
+
+/**
+ * Hash count consecutive nonces from nonce_base, eight per vector
+ * (count must be a multiple of 8). The state never leaves registers
+ * between the three SHA3-256 passes. Returns nonzero when any digest's
+ * big-endian top 64 bits are below target; each vector compare is OR-ed
+ * into a mask register, so there is no per-nonce branch.
+ */
+SHA3X_EXPORT SHA3X_TARGET_AVX512 int sha3x_scan_x8_avx512(
+    const uint64_t header[4], uint64_t nonce_base, uint64_t count, uint64_t target
+) {
+    __m512i a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12;
+    __m512i a13, a14, a15, a16, a17, a18, a19, a20, a21, a22, a23, a24;
+    KECCAK_TEMPS;
+
+    const __m512i zero = _mm512_setzero_si512();
+    const __m512i h0 = _mm512_set1_epi64((long long)header[0]);
+    const __m512i h1 = _mm512_set1_epi64((long long)header[1]);
+    const __m512i h2 = _mm512_set1_epi64((long long)header[2]);
+    const __m512i h3 = _mm512_set1_epi64((long long)header[3]);
+    const __m512i first_pad = _mm512_set1_epi64((long long)(0x01ULL | (SHA3_PAD << 8)));
+    const __m512i pad = _mm512_set1_epi64((long long)SHA3_PAD);
+    const __m512i pad_last = _mm512_set1_epi64((long long)SHA3_PAD_LAST);
+    const __m512i step = _mm512_set1_epi64(X8);
+    const __m512i limit = _mm512_set1_epi64((long long)target);
+    __mmask8 found = 0;
+    __m512i nonces = _mm512_add_epi64(
+        _mm512_set1_epi64((long long)nonce_base),
+        _mm512_set_epi64(7, 6, 5, 4, 3, 2, 1, 0)
+    );
+
+    for (uint64_t i = 0; i < count; i += X8) {
+        // First pass: 41-byte SHA3X header
+        a0 = nonces;
+        a1 = h0; a2 = h1; a3 = h2; a4 = h3;
+        a5 = first_pad;
+        a6 = a7 = a8 = a9 = a10 = a11 = a12 = a13 = a14 = a15 = zero;
+        a16 = pad_last;
+        a17 = a18 = a19 = a20 = a21 = a22 = a23 = a24 = zero;
+        for (int round = 0; round < 24; round++) {
+            KECCAK_ROUND(RC[round]);
+        }
+
+        // Second and third passes over the 32-byte digest
+        for (int pass = 0; pass < 2; pass++) {
+            a4 = pad;
+            a5 = a6 = a7 = a8 = a9 = a10 = a11 = a12 = a13 = a14 = a15 = zero;
+            a16 = pad_last;
+            a17 = a18 = a19 = a20 = a21 = a22 = a23 = a24 = zero;
+            for (int round = 0; round < 24; round++) {
+                KECCAK_ROUND(RC[round]);
+            }
+        }
+
+        found |= _mm512_cmplt_epu64_mask(bswap64_x8(a0), limit);
+        nonces = _mm512_add_epi64(nonces, step);
+    }
+
+    return found != 0;
+}
+
+/**
+ * Nonzero when the running CPU implements AVX-512F and AVX-512VL
+ */
+SHA3X_EXPORT int keccak_avx512_supported(void) {
+#if defined(_MSC_VER)
+    int regs[4];
+    __cpuid(regs, 1);
+    if (!((regs[2] >> 27) & 1)) {
+        return 0;  // no OSXSAVE: ZMM state is not preserved by the OS
+    }
+    if ((_xgetbv(0) & 0xE6) != 0xE6) {
+        return 0;
+    }
+    __cpuidex(regs, 7, 0);
+    return ((regs[1] >> 16) & 1) && ((regs[1] >> 31) & 1);
+#else
+    __builtin_cpu_init();
+    return __builtin_cpu_supports("avx512f") && __builtin_cpu_supports("avx512vl");
+#endif
+}
@@ -0,0 +1,236 @@
+/**
+ * SHA3X Keccak-f[1600] for x86-64 with BMI2
+ * Scalar CPU kernel for the Python demo miner, loaded through ctypes
+ * (see _keccak_native.py). Every rho rotate has an immediate count, so
+ * with BMI2 enabled the compiler emits the flag-free RORX instead of the
+ * SHL/SHR/OR triple; BMI1 turns each chi ~b & c into a single ANDN.
+ */
+
+#include <stdint.h>
+#include <string.h>
+
+#if defined(_MSC_VER)
+#include <intrin.h>
+#include <stdlib.h>
+#define SHA3X_EXPORT __declspec(dllexport)
+// MSVC has no per-function target attribute; RORX needs /arch:AVX2
+#define SHA3X_TARGET_BMI2
+#define ROTL64(x, n) _rotl64((x), (n))
+#define BSWAP64(x) _byteswap_uint64(x)
+#else
+#define SHA3X_EXPORT __attribute__((visibility("default")))
+#define SHA3X_TARGET_BMI2 __attribute__((target("bmi,bmi2")))
+#define BSWAP64(x) __builtin_bswap64(x)
+#if defined(__clang__)
+#define ROTL64(x, n) __builtin_rotateleft64((x), (n))
+#else
+#define ROTL64(x, n) (((x) << (n)) | ((x) >> (64 - (n))))
+#endif
+#endif
+
+// SHA3-256 padding within one 136-byte rate block
+#define SHA3_PAD 0x06ULL
+#define SHA3_PAD_LAST 0x8000000000000000ULL
+
+// Round constants for Keccak-f[1600]
+static const uint64_t RC[24] = {
+    0x0000000000000001ULL, 0x0000000000008082ULL, 0x800000000000808aULL,
+    0x8000000080008000ULL, 0x000000000000808bULL, 0x0000000080000001ULL,
+    0x8000000080008081ULL, 0x8000000000008009ULL, 0x000000000000008aULL,
+    0x0000000000000088ULL, 0x0000000080008009ULL, 0x000000008000000aULL,
+    0x000000008000808bULL, 0x800000000000008bULL, 0x8000000000008089ULL,
+    0x8000000000008003ULL, 0x8000000000008002ULL, 0x8000000000000080ULL,
+    0x000000000000800aULL, 0x800000008000000aULL, 0x8000000080008081ULL,
+    0x8000000000008080ULL, 0x0000000080000001ULL, 0x8000000080008008ULL
+};
+
+/**
+ * One Keccak-f[1600] round on the lanes a0..a24
+ */
+#define KECCAK_ROUND(rc) \
+    /* θ (theta) step */ \
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20; \
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21; \
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22; \
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23; \
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24; \
+    d0 = c4 ^ ROTL64(c1, 1); \
+    d1 = c0 ^ ROTL64(c2, 1); \
+    d2 = c1 ^ ROTL64(c3, 1); \
+    d3 = c2 ^ ROTL64(c4, 1); \
+    d4 = c3 ^ ROTL64(c0, 1); \
+    /* ρ (rho) and π (pi) steps, immediate rotate counts */ \
+    b0 = a0 ^ d0; \
+    b10 = ROTL64(a1 ^ d1, 1); \
+    b20 = ROTL64(a2 ^ d2, 62); \
+    b5 = ROTL64(a3 ^ d3, 28); \
+    b15 = ROTL64(a4 ^ d4, 27); \
+    b16 = ROTL64(a5 ^ d0, 36); \
+    b1 = ROTL64(a6 ^ d1, 44); \
+    b11 = ROTL64(a7 ^ d2, 6); \
+    b21 = ROTL64(a8 ^ d3, 55); \
+    b6 = ROTL64(a9 ^ d4, 20); \
+    b7 = ROTL64(a10 ^ d0, 3); \
+    b17 = ROTL64(a11 ^ d1, 10); \
+    b2 = ROTL64(a12 ^ d2, 43); \
+    b12 = ROTL64(a13 ^ d3, 25); \
+    b22 = ROTL64(a14 ^ d4, 39); \
+    b23 = ROTL64(a15 ^ d0, 41); \
+    b8 = ROTL64(a16 ^ d1, 45); \
+    b18 = ROTL64(a17 ^ d2, 15); \
+    b3 = ROTL64(a18 ^ d3, 21); \
+    b13 = ROTL64(a19 ^ d4, 8); \
+    b14 = ROTL64(a20 ^ d0, 18); \
+    b24 = ROTL64(a21 ^ d1, 2); \
+    b9 = ROTL64(a22 ^ d2, 61); \
+    b19 = ROTL64(a23 ^ d3, 56); \
+    b4 = ROTL64(a24 ^ d4, 14); \
+    /* χ (chi) step */ \
+    a0 = b0 ^ (~b1 & b2); \
+    a1 = b1 ^ (~b2 & b3); \
+    a2 = b2 ^ (~b3 & b4); \
+    a3 = b3 ^ (~b4 & b0); \
+    a4 = b4 ^ (~b0 & b1); \
+    a5 = b5 ^ (~b6 & b7); \
+    a6 = b6 ^ (~b7 & b8); \
+    a7 = b7 ^ (~b8 & b9); \
+    a8 = b8 ^ (~b9 & b5); \
+    a9 = b9 ^ (~b5 & b6); \
+    a10 = b10 ^ (~b11 & b12); \
+    a11 = b11 ^ (~b12 & b13); \
+    a12 = b12 ^ (~b13 & b14); \
+    a13 = b13 ^ (~b14 & b10); \
+    a14 = b14 ^ (~b10 & b11); \
+    a15 = b15 ^ (~b16 & b17); \
+    a16 = b16 ^ (~b17 & b18); \
+    a17 = b17 ^ (~b18 & b19); \
+    a18 = b18 ^ (~b19 & b15); \
+    a19 = b19 ^ (~b15 & b16); \
+    a20 = b20 ^ (~b21 & b22); \
+    a21 = b21 ^ (~b22 & b23); \
+    a22 = b22 ^ (~b23 & b24); \
+    a23 = b23 ^ (~b24 & b20); \
+    a24 = b24 ^ (~b20 & b21); \
+    /* ι (iota) step */ \
+    a0 ^= (rc)
+
+/**
+ * Keccak-f[1600] permutation, in place on a 25-lane state
+ */
+SHA3X_EXPORT SHA3X_TARGET_BMI2 void keccak_f1600_bmi2(uint64_t st[25]) {
+    uint64_t a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12, a13, a14, a15, a16, a17, a18, a19, a20, a21, a22, a23, a24;
+    uint64_t b0, b1, b2, b3, b4, b5, b6, b7, b8, b9, b10, b11, b12, b13, b14, b15, b16, b17, b18, b19, b20, b21, b22, b23, b24;
+    uint64_t c0, c1, c2, c3, c4, d0, d1, d2, d3, d4;
+
+    a0 = st[0];
+    a1 = st[1];
+    a2 = st[2];
+    a3 = st[3];
+    a4 = st[4];
+    a5 = st[5];
+    a6 = st[6];
+    a7 = st[7];
+    a8 = st[8];
+    a9 = st[9];
+    a10 = st[10];
+    a11 = st[11];
+    a12 = st[12];
+    a13 = st[13];
+    a14 = st[14];
+    a15 = st[15];
+    a16 = st[16];
+    a17 = st[17];
+    a18 = st[18];
+    a19 = st[19];
+    a20 = st[20];
+    a21 = st[21];
+    a22 = st[22];
+    a23 = st[23];
+    a24 = st[24];
+
+    for (int round = 0; round < 24; round++) {
+        KECCAK_ROUND(RC[round]);
+    }
+
+    st[0] = a0;
+    st[1] = a1;
+    st[2] = a2;
+    st[3] = a3;
+    st[4] = a4;
+    st[5] = a5;
+    st[6] = a6;
+    st[7] = a7;
+    st[8] = a8;
+    st[9] = a9;
+    st[10] = a10;
+    st[11] = a11;
+    st[12] = a12;
+    st[13] = a13;
+    st[14] = a14;
+    st[15] = a15;
+    st[16] = a16;
+    st[17] = a17;
+    st[18] = a18;
+    st[19] = a19;
+    st[20] = a20;
+    st[21] = a21;
+    st[22] = a22;
+    st[23] = a23;
+    st[24] = a24;
+}
+
+/**
+ * SHA3X digest of one nonce: SHA3-256 applied three times to
+ * nonce (LE) || mining_hash || 0x01. Digest is left in st[0..3].
+ */
+static SHA3X_TARGET_BMI2 void sha3x_hash_bmi2(const uint64_t header[4], uint64_t nonce, uint64_t st[25]) {
+    // First pass: 41-byte SHA3X header
+    memset(st, 0, 25 * sizeof(uint64_t));
+    st[0] = nonce;
+    st[1] = header[0];
+    st[2] = header[1];
+    st[3] = header[2];
+    st[4] = header[3];
+    st[5] = 0x01ULL | (SHA3_PAD << 8);
+    st[16] = SHA3_PAD_LAST;
+    keccak_f1600_bmi2(st);
+
+    // Second and third passes over the 32-byte digest
+    for (int pass = 0; pass < 2; pass++) {
+        memset(st + 4, 0, 21 * sizeof(uint64_t));
+        st[4] = SHA3_PAD;
+        st[16] = SHA3_PAD_LAST;
+        keccak_f1600_bmi2(st);
+    }
+}
+
+/**
+ * Hash count consecutive nonces from nonce_base. Returns nonzero when any
+ * digest's big-endian top 64 bits are below target; the comparison is
+ * OR-ed into a flag so the loop carries no data-dependent branch.
+ */
+SHA3X_EXPORT SHA3X_TARGET_BMI2 int sha3x_scan_bmi2(
+    const uint64_t header[4], uint64_t nonce_base, uint64_t count, uint64_t target
+) {
+    uint64_t st[25];
+    uint64_t found = 0;
+    for (uint64_t i = 0; i < count; i++) {
+        sha3x_hash_bmi2(header, nonce_base + i, st);
+        found |= (uint64_t)(BSWAP64(st[0]) < target);
+    }
+    return found != 0;
+}
+
+/**
+ * Nonzero when the running CPU implements BMI1 and BMI2
+ */
+SHA3X_EXPORT int keccak_bmi2_supported(void) {
+#if defined(_MSC_VER)
+    int regs[4];
+    __cpuidex(regs, 7, 0);
+    return ((regs[1] >> 3) & 1) && ((regs[1] >> 8) & 1);
+#else
+    __builtin_cpu_init();
+    return __builtin_cpu_supports("bmi") && __builtin_cpu_supports("bmi2");
+#endif
+}
@@ -0,0 +1,22 @@
+"""
+Tests for the Numba SHA3X kernels in _keccak
+"""
+
+import numpy as np
+import pytest
+
+import _sha3x
+
+_keccak = pytest.importorskip("_keccak")
+
+
+@pytest.mark.parametrize("nonce", [0, 1, 0x0123456789ABCDEF, 2**64 - 1])
+def test_sha3x_hash_matches_hashlib(mining_hash, header, nonce):
+    lanes = _keccak.sha3x_hash(np.uint64(nonce), header)
+    digest = np.array(lanes, dtype=np.uint64).astype("<u8").tobytes()
+    assert digest == _sha3x.sha3x_digest(mining_hash, nonce)
+
+
+def test_scan_flags(header, target, scan_windows):
+    for base, count, hit in scan_windows:
+        assert _keccak.scan(header, np.uint64(base), count, np.uint64(target)) == hit
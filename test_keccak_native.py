@@ -0,0 +1,25 @@
+"""
+Tests for the native C kernels loaded by _keccak_native
+"""
+
+import pytest
+
+import _keccak_native
+
+
+@pytest.mark.skipif(not _keccak_native.AVX2_AVAILABLE, reason="AVX2 kernel unavailable")
+def test_scan_x4_avx2_flags(header, target, scan_windows):
+    for base, count, hit in scan_windows:
+        assert _keccak_native.scan_x4_avx2(header, base, count, target) == hit
+
+
+@pytest.mark.skipif(not _keccak_native.BMI2_AVAILABLE, reason="BMI2 kernel unavailable")
+def test_scan_bmi2_flags(header, target, scan_windows):
+    for base, count, hit in scan_windows:
+        assert _keccak_native.scan_bmi2(header, base, count, target) == hit
+
+
+@pytest.mark.skipif(not _keccak_native.AVX512_AVAILABLE, reason="AVX-512 kernel unavailable")
+def test_scan_x8_avx512_flags(header, target, scan_windows):
+    for base, count, hit in scan_windows:
+        assert _keccak_native.scan_x8_avx512(header, base, count, target) == hit
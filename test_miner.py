@@ -0,0 +1,25 @@
+"""
+Tests for the Cython mining driver in _miner
+"""
+
+import pytest
+
+import _sha3x
+
+_miner = pytest.importorskip("_miner")
+
+pytestmark = pytest.mark.skipif(not _miner.AVAILABLE, reason="no native kernel for this CPU")
+
+
+def test_mine_burst_hit_chunks(mining_hash, header):
+    chunk = _miner.CHUNK_SIZE
+    batch = 4 * chunk
+    # About two winners per chunk, so some chunks miss
+    target = (1 << 64) // (chunk // 2)
+    winners = _sha3x.find_shares(mining_hash, 0, batch, target)
+    expected = sorted({nonce - nonce % chunk for nonce in winners})
+    assert _miner.mine_burst(0, batch, header, target) == (batch, expected)
+
+
+def test_mine_burst_rounds_down_to_whole_chunks(header):
+    assert _miner.mine_burst(0, _miner.CHUNK_SIZE - 1, header, 0) == (0, [])
@@ -0,0 +1,26 @@
+"""
+Tests for the CUDA SHA3X kernel in sha3x_cuda
+"""
+
+import pytest
+
+import _sha3x
+
+sha3x_cuda = pytest.importorskip("sha3x_cuda")
+
+pytestmark = pytest.mark.skipif(
+    not sha3x_cuda.is_available(), reason="no CUDA device or simulator"
+)
+
+
+def test_scan_returns_lowest_winner(mining_hash, header, target):
+    first = _sha3x.find_shares(mining_hash, 0, 4096, target)[0]
+    scanner = sha3x_cuda.CudaSHA3XScanner(batch_size=256, threads_per_block=64)
+    # A batch holding the first reference winner, which is its lowest
+    base = first - first % 256
+    assert scanner.scan(header, base, target) == first
+
+
+def test_scan_without_solution(header):
+    scanner = sha3x_cuda.CudaSHA3XScanner(batch_size=256, threads_per_block=64)
+    assert scanner.scan(header, 0, 0) is None